@@ -1,6 +1,21 @@
 
 const $ = (sel, root=document) => root.querySelector(sel);
-let pingSeries = [];
+
+// Fixed-capacity ring buffer: no shift() re-indexing and no unbounded
+// growth no matter how long the page stays open.
+const PING_CAPACITY = 40;
+const pingSeries = new Float64Array(PING_CAPACITY);
+let pingHead = 0, pingCount = 0;
+
+function pushPing(v){
+  pingSeries[pingHead] = v;
+  pingHead = (pingHead + 1) % PING_CAPACITY;
+  if(pingCount < PING_CAPACITY) pingCount++;
+}
+
+function pingAt(i){
+  return pingSeries[(pingHead - pingCount + i + PING_CAPACITY) % PING_CAPACITY];
+}
 
 function addMessage(user, text, meta){
   const m = document.createElement('div');
@@ -12,13 +27,34 @@ function addMessage(user, text, meta){
   return m;
 }
 
+const MODELS_TTL_MS = 60000;
+const modelsCache = new Map(); // provider -> {ts, data}
+const modelsInFlight = new Map(); // provider -> Promise
+
+function fetchModels(provider){
+  const hit = modelsCache.get(provider);
+  if(hit && performance.now() - hit.ts < MODELS_TTL_MS) return Promise.resolve(hit.data);
+  // Single-flight: concurrent callers share the one pending request.
+  let pending = modelsInFlight.get(provider);
+  if(!pending){
+    pending = fetch(`/models/${provider}`)
+      .then(resp => resp.json())
+      .then(data => {
+        modelsCache.set(provider, {ts: performance.now(), data});
+        return data;
+      })
+      .finally(() => modelsInFlight.delete(provider));
+    modelsInFlight.set(provider, pending);
+  }
+  return pending;
+}
+
 async function refreshModels(){
   const provider = $('#provider').value;
   const sel = $('#model');
   sel.innerHTML = '<option>Loading…</option>';
   try {
-    const resp = await fetch(`/models/${provider}`);
-    const data = await resp.json();
+    const data = await fetchModels(provider);
     sel.innerHTML = '';
     const models = data.models || [];
     if(models.length){
@@ -57,14 +93,24 @@ async function sendMessage(){
   }
   const reader = response.body.getReader();
   const decoder = new TextDecoder();
-  let acc = '';
   const div = addMessage('Bot','');
+  // Stream into a dedicated text node: no per-token innerHTML re-parse,
+  // no re-escaping of the whole accumulated reply, and paints are
+  // coalesced to one DOM write per animation frame.
+  const textNode = document.createTextNode('');
+  div.appendChild(textNode);
+  let acc = '';
+  let frame = 0;
+  const flush = () => { frame = 0; textNode.data = acc; };
   while(true){
     const {done, value} = await reader.read();
     if(done) break;
     acc += decoder.decode(value, {stream:true});
-    div.innerHTML = `<strong>Bot:</strong> ${acc.replace(/</g,'&lt;')}`;
+    if(!frame) frame = requestAnimationFrame(flush);
   }
+  acc += decoder.decode();
+  if(frame) cancelAnimationFrame(frame);
+  flush();
   const meta = `Provider: ${provider} • Model: ${model}`;
   const metaNode = document.createElement('div');
   metaNode.className='meta'; metaNode.textContent = meta;
@@ -80,15 +126,14 @@ async function ping(provider){
   const badge = resp.ok ? 'ok' : 'err';
   const reason = data.detail ? ` • ${data.detail}` : '';
   addMessage('Ping', `${provider.toUpperCase()} → <span class="pill ${badge}">${resp.status} ${resp.statusText}</span> (${ms} ms)`, reason);
-  pingSeries.push(resp.ok ? ms : -1);
-  if(pingSeries.length>40) pingSeries.shift();
+  pushPing(resp.ok ? ms : -1);
   drawSparkline();
 }
 
 async function pingAll(){
-  for(const p of ['openai','openrouter','qwen','ollama','genesis']){
-    await ping(p);
-  }
+  // Fire all probes at once: total wall time becomes max(latency)
+  // instead of the sum of five sequential round-trips.
+  await Promise.allSettled(['openai','openrouter','qwen','ollama','genesis'].map(ping));
 }
 
 async function testStorage(){
@@ -146,16 +191,20 @@ function drawSparkline(){
   const w = canvas.width = canvas.clientWidth;
   const h = canvas.height = canvas.clientHeight;
   ctx.clearRect(0,0,w,h);
-  if(!pingSeries.length) return;
-  const values = pingSeries.map(v=> v<0 ? 0 : v);
-  const max = Math.max(...values, 100);
-  const step = w/Math.max(pingSeries.length-1, 1);
+  if(!pingCount) return;
+  let max = 100;
+  for(let i=0;i<pingCount;i++){
+    const v = pingAt(i);
+    if(v > max) max = v;
+  }
+  const step = w/Math.max(pingCount-1, 1);
   ctx.beginPath();
-  pingSeries.forEach((v,i)=>{
+  for(let i=0;i<pingCount;i++){
+    const v = pingAt(i);
     const x = i*step;
     const y = v<0 ? h-2 : h - (v/max)*h;
     if(i===0) ctx.moveTo(x,y); else ctx.lineTo(x,y);
-  });
+  }
   ctx.lineWidth = 2; ctx.strokeStyle = '#4B9FFF';
   ctx.stroke();
 }
@@ -8,121 +8,366 @@ from __future__ import annotations
 
 import json
 import os
+import signal
 import socket
 import subprocess
 import sys
+import tempfile
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-import requests
+from utils import get_python_executable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_PATH = BASE_DIR / "config.json"
 SERVER_PATH = BASE_DIR / "server.py"
 LOG_DIR = BASE_DIR / "logs"
 
+# These Paths are constants; stringify once instead of per spawn.
+_BASE_DIR_STR = os.fspath(BASE_DIR)
+_SERVER_PATH_STR = os.fspath(SERVER_PATH)
+
+_config_cache: Optional[Dict[str, Any]] = None
+
 
 def load_config() -> Dict[str, Any]:
-    if not CONFIG_PATH.exists():
-        raise FileNotFoundError("config.json not found. Run setup_wizard.py first.")
-    with CONFIG_PATH.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+    global _config_cache
+    if _config_cache is not None:
+        return _config_cache
+    try:
+        raw = CONFIG_PATH.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError("config.json not found. Run setup_wizard.py first.") from None
+    _config_cache = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return _config_cache
 
 
 def save_config(config: Dict[str, Any]) -> None:
-    CONFIG_PATH.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    # Atomic replace so a crash mid-write never leaves a torn config.json.
+    if orjson is not None:
+        payload = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(config, indent=2).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=BASE_DIR, prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp_path, CONFIG_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _port_looks_free(host: str, port: int) -> bool:
+    # Quick connect probe: if something answers, the port is obviously
+    # taken and we can skip allocating a bind attempt.
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.settimeout(0.01)
+        return probe.connect_ex((host, port)) != 0
 
 
 def find_available_port(host: str, start_port: int, attempts: int = 20) -> int:
-    candidate = start_port
-    for _ in range(attempts):
+    candidates = range(start_port, start_port + attempts)
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        looks_free = dict(zip(candidates, pool.map(lambda p: _port_looks_free(host, p), candidates)))
+
+    # The probes only filter; the bind below stays authoritative (and on
+    # the main thread) so a race with another process cannot hand us a
+    # port we can no longer claim.
+    for candidate in candidates:
+        if not looks_free[candidate]:
+            continue
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             try:
                 sock.bind((host, candidate))
                 return candidate
             except OSError:
-                candidate += 1
+                continue
     raise RuntimeError("Unable to find open port for MONKY server")
 
 
+def _server_endpoint(config: Dict[str, Any]) -> tuple[str, int]:
+    server_cfg = config.get("server") or {}
+    return server_cfg.get("host", "127.0.0.1"), int(server_cfg.get("port", 5050))
+
+
 def ensure_server_port(config: Dict[str, Any]) -> tuple[str, int]:
-    server_cfg = config.setdefault("server", {})
-    host = server_cfg.get("host", "127.0.0.1")
-    desired_port = int(server_cfg.get("port", 5050))
-    port = find_available_port(host, desired_port)
-    if port != desired_port:
-        print(f"[MONKY] Port {desired_port} unavailable; hopping to {port}")
-        server_cfg["port"] = port
-        save_config(config)
+    host, desired_port = _server_endpoint(config)
+    # Steady-state fast path: if the preferred port binds, there is
+    # nothing to update and no reason to scan or touch config.json.
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host, desired_port))
+            return host, desired_port
+        except OSError:
+            pass
+
+    port = find_available_port(host, desired_port + 1, attempts=19)
+    print(f"[MONKY] Port {desired_port} unavailable; hopping to {port}")
+    config.setdefault("server", {})["port"] = port
+    save_config(config)
     return host, port
 
 
-def start_server() -> subprocess.Popen[Any]:
-    python = sys.executable
-    if os.name == "nt":
-        pythonw = Path(python).with_name("pythonw.exe")
-        if pythonw.exists():
-            python = str(pythonw)
+def create_listen_socket(host: str, port: int) -> Optional[socket.socket]:
+    """Bind the server port in the launcher for socket-activation handoff.
+
+    Returns ``None`` when the bind fails or fd passing is unsupported, in
+    which case the caller falls back to letting the server bind itself.
+    """
+    if os.name != "posix":
+        return None
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind((host, port))
+        sock.listen(128)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+class SpawnedProcess:
+    """Minimal Popen-compatible handle around an os.posix_spawn pid."""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                self.returncode = 0
+            else:
+                if pid == self.pid:
+                    self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        deadline_ns = None if timeout is None else time.monotonic_ns() + int(timeout * 1_000_000_000)
+        while self.poll() is None:
+            if deadline_ns is not None and time.monotonic_ns() >= deadline_ns:
+                raise subprocess.TimeoutExpired(cmd=f"pid {self.pid}", timeout=timeout)
+            time.sleep(0.05)
+        return self.returncode  # type: ignore[return-value]
+
+    def _signal(self, sig: int) -> None:
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self) -> None:
+        self._signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self._signal(signal.SIGKILL)
+
+
+def start_server(listen_sock: Optional[socket.socket] = None) -> Any:
+    python = get_python_executable()
 
     LOG_DIR.mkdir(exist_ok=True)
     log_path = LOG_DIR / "monky-server.log"
-    with log_path.open("a", encoding="utf-8") as log_file:
-        process = subprocess.Popen(
-            [python, str(SERVER_PATH)],
-            stdout=log_file,
-            stderr=log_file,
-            cwd=BASE_DIR,
-            env={**os.environ, "PYTHONUNBUFFERED": "1"},
-        )
+    # Raw append-mode fd: the child dup2's it for stdout/stderr, so no
+    # buffered Python file object needs to exist in the parent at all.
+    log_fd = os.open(
+        str(log_path),
+        os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0),
+        0o644,
+    )
+    if listen_sock is not None:
+        # Hand the already-bound socket to the child; it advertises the fd
+        # through the parent environ (inherited) rather than an env copy.
+        listen_sock.set_inheritable(True)
+        os.environ["MONKY_LISTEN_FD"] = str(listen_sock.fileno())
+    try:
+        # `-u` gives the child unbuffered stdio without cloning the whole
+        # environ table just to inject PYTHONUNBUFFERED.
+        argv = [python, "-u", _SERVER_PATH_STR]
+        if os.name == "posix":
+            # posix_spawn avoids fork's page-table duplication; the server
+            # resolves every path from its own BASE_DIR, so no cwd needed.
+            pid = os.posix_spawn(
+                python,
+                argv,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, log_fd, 1),
+                    (os.POSIX_SPAWN_DUP2, log_fd, 2),
+                ],
+            )
+            return SpawnedProcess(pid)
+        return subprocess.Popen(argv, stdout=log_fd, stderr=log_fd, cwd=_BASE_DIR_STR)
+    finally:
+        os.close(log_fd)
+        os.environ.pop("MONKY_LISTEN_FD", None)
+
+
+def _wait_for_exit(process: Any, timeout: float) -> bool:
+    """Wait for *process* to exit, returning True if it did.
+
+    On Linux this blocks on a pidfd so we wake the instant the child
+    exits; elsewhere it falls back to ``process.wait`` polling.
+    """
+    if hasattr(os, "pidfd_open"):
+        import select
+
+        try:
+            fd = os.pidfd_open(process.pid)
+        except OSError:
+            pass  # already gone, or pidfd unsupported at runtime
+        else:
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                poller.poll(int(timeout * 1000))
+            finally:
+                os.close(fd)
+            return process.poll() is not None
 
-    return process
+    if hasattr(signal, "sigtimedwait"):
+        # POSIX without pidfd: sleep in sigtimedwait until SIGCHLD fires
+        # instead of letting process.wait() poll waitpid with sleeps.
+        deadline_ns = time.monotonic_ns() + int(timeout * 1_000_000_000)
+        old_mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
+        try:
+            while process.poll() is None:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    return False
+                signal.sigtimedwait({signal.SIGCHLD}, remaining_ns / 1_000_000_000)
+        finally:
+            signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+        return True
 
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return False
+    return True
 
-def stop_server(process: subprocess.Popen[Any]) -> None:
+
+def stop_server(process: Any) -> None:
     if process.poll() is not None:
         return
     process.terminate()
-    try:
-        process.wait(timeout=5)
-    except subprocess.TimeoutExpired:
+    if not _wait_for_exit(process, timeout=5):
         process.kill()
 
 
 def wait_for_health(host: str, port: int, timeout: int = 30) -> bool:
-    url = f"http://{host}:{port}/health"
-    start = time.time()
-    while time.time() - start < timeout:
-        try:
-            response = requests.get(url, timeout=2)
-            if response.ok:
-                return True
-        except requests.RequestException:
-            time.sleep(1)
-        else:
-            time.sleep(1)
-    return False
+    # Monotonic integer deadline: immune to NTP clock steps and cheaper
+    # to compare than floats.
+    deadline_ns = time.monotonic_ns() + timeout * 1_000_000_000
+
+    # Cheap TCP probe first: spin on connect_ex until the port accepts
+    # connections, then issue a single HTTP request to confirm the app is
+    # actually serving rather than paying a full HTTP round trip per attempt.
+    # The sleep backs off exponentially (20 ms doubling to 200 ms) so a fast
+    # server start is noticed within tens of milliseconds while a slow one
+    # is not busy-polled.
+    delay = 0.02
+    while time.monotonic_ns() < deadline_ns:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.2)
+            if sock.connect_ex((host, port)) == 0:
+                break
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+    else:
+        return False
+
+    # Stdlib http.client for the single confirmation GET: the launcher no
+    # longer drags in the requests/urllib3 import graph just for this.
+    import http.client
+
+    conn = http.client.HTTPConnection(host, port, timeout=2)
+    try:
+        conn.request("GET", "/health")
+        response = conn.getresponse()
+        return 200 <= response.status < 400
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        conn.close()
 
 
-def open_launcher(config: Dict[str, Any]) -> None:
-    host = config.get("server", {}).get("host", "127.0.0.1")
-    port = int(config.get("server", {}).get("port", 5050))
-    webbrowser.open(f"http://{host}:{port}/launch")
+def _can_open_browser() -> bool:
+    if sys.platform.startswith("linux") and not (
+        os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+    ):
+        return False
+    if os.environ.get("SSH_CONNECTION"):
+        return False
+    return True
+
+
+_APP_PATH = {"work": "/work", "home": "/home", "mobile": "/m"}
+
+
+def _entry_path(config: Dict[str, Any]) -> str:
+    """Pick the UI to open: the selector when several cockpits are
+    enabled, or straight into the only enabled (or default) one."""
+    features = config.get("features") or {}
+    default_app = config.get("apps", {}).get("default", "work")
+    first_enabled = None
+    default_enabled = False
+    count = 0
+    for app in ("work", "home", "mobile"):
+        if features.get(app, True):
+            count += 1
+            first_enabled = first_enabled or app
+            if app == default_app:
+                default_enabled = True
+    if count != 1:
+        return "/launch"
+    chosen = default_app if default_enabled else (first_enabled or "work")
+    return _APP_PATH.get(chosen, "/launch")
+
+
+def open_launcher(config: Dict[str, Any], host: str, port: int) -> None:
+    url = f"http://{host}:{port}{_entry_path(config)}"
+    if not _can_open_browser():
+        print(f"[MONKY] Headless session detected; open {url} manually")
+        return
+    webbrowser.open(url)
 
 
 def main() -> None:
     config = load_config()
     host, port = ensure_server_port(config)
 
-    process = start_server()
+    # With socket activation the port is bound before the child even
+    # starts, so connections queue in the kernel and the health-polling
+    # loop is unnecessary.
+    listen_sock = create_listen_socket(host, port)
+    process = start_server(listen_sock)
     try:
-        if not wait_for_health(host, port):
+        if listen_sock is not None:
+            listen_sock.close()
+        elif not wait_for_health(host, port):
             stop_server(process)
             raise RuntimeError("MONKY server failed to start within timeout")
 
-        open_launcher(config)
+        open_launcher(config, host, port)
         print(f"MONKY server online at http://{host}:{port}")
         time.sleep(2)
     except KeyboardInterrupt:
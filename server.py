@@ -1,42 +1,55 @@
 import atexit
 import base64
+import gzip
+import hashlib
+import hmac
 import io
 import json
+import mimetypes
 import os
-import random
+import queue
+import re
 import signal
 import socket
 import time
 import sqlite3
+import tempfile
 import threading
 import webbrowser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 
-try:
-    from PIL import Image, ImageDraw
-except Exception:  # pragma: no cover - optional dependency
-    Image = ImageDraw = None  # type: ignore
-    _PIL_AVAILABLE = False
-else:
-    _PIL_AVAILABLE = True
+try:  # optional: faster JSON responses when available
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
-try:
-    import pystray
-except Exception:  # pragma: no cover - optional dependency
-    pystray = None  # type: ignore
+import importlib.util
+
+# The tray stack (pystray + PIL) is only needed when a desktop session
+# exists; defer the actual imports so headless server starts skip them.
+_PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+_PYSTRAY_AVAILABLE = importlib.util.find_spec("pystray") is not None
+# Optional: pandas can parse CSV several-fold faster through Arrow.
+_PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from flask import (Flask, abort, g, jsonify, redirect, request,
                    send_from_directory, url_for)
+from flask.json.provider import DefaultJSONProvider
 
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_PATH = BASE_DIR / "config.json"
@@ -55,12 +68,47 @@ def load_config() -> Dict:
 
 
 config = load_config()
+_last_config_payload: Optional[bytes] = None
+
+
+def persist_config() -> None:
+    """Write config.json atomically, skipping the write when nothing changed."""
+    global _last_config_payload, _config_version
+    # The in-memory config was mutated either way; drop memoized views.
+    _config_version += 1
+    payload = json.dumps(config, indent=2).encode("utf-8")
+    if payload == _last_config_payload:
+        return
+    fd, tmp_path = tempfile.mkstemp(dir=BASE_DIR, prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp_path, CONFIG_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    _last_config_payload = payload
 DB_PATH = Path(config.get("paths", {}).get("db_path", DEFAULT_DB_PATH))
 if not DB_PATH.is_absolute():
     DB_PATH = BASE_DIR / DB_PATH
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson: serializes straight to bytes."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 app.secret_key = os.environ.get("MONKY_SECRET", os.urandom(32))
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 scheduler = BackgroundScheduler(daemon=True)
 _scheduler_started = False
@@ -102,10 +150,17 @@ def resolve_storage_path(scope: Optional[str] = None, override: Optional[str] =
 
 
 def find_available_port(host: str, start_port: int, attempts: int = 20) -> int:
-    candidate = start_port
-    for _ in range(attempts):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # Port 0 asks the kernel for any free port in one bind; a start_port of
+    # 0 therefore never needs the scan below.
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if start_port == 0:
+            sock.bind((host, 0))
+            return sock.getsockname()[1]
+        # One socket for the whole probe loop instead of a fresh fd per
+        # candidate; a failed bind leaves the socket reusable.
+        candidate = start_port
+        for _ in range(attempts):
             try:
                 sock.bind((host, candidate))
                 return candidate
@@ -116,6 +171,7 @@ def find_available_port(host: str, start_port: int, attempts: int = 20) -> int:
 
 _tray_icon = None
 _tray_thread: Optional[threading.Thread] = None
+_tray_icon_png: Optional[bytes] = None
 
 
 PROVIDER_DEFINITIONS = {
@@ -157,11 +213,57 @@ PROVIDER_DEFINITIONS = {
     },
 }
 
+# Flat (key, model_key, default_model) tuples so the per-request hot path
+# destructures once instead of chaining spec.get() calls.
+_PROVIDER_SPEC_CACHE = {
+    name: (spec.get("key"), spec.get("model_key"), spec.get("default_model"))
+    for name, spec in PROVIDER_DEFINITIONS.items()
+}
+
+
+def _configure_conn(conn: sqlite3.Connection) -> sqlite3.Connection:
+    # WAL + NORMAL collapses the per-commit double fsync to checkpoint
+    # boundaries and lets readers run while the scheduler writes.  The
+    # journal mode itself persists in the database header; the rest are
+    # per-connection settings.
+    conn.executescript(
+        """
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-65536;
+        PRAGMA mmap_size=268435456;
+        PRAGMA busy_timeout=3000;
+        PRAGMA foreign_keys=ON;
+        """
+    )
+    return conn
+
+
+# Bounded connection pool: request handlers borrow an already-configured
+# connection instead of paying sqlite3_open plus PRAGMA replay per request.
+_POOL_SIZE = 8
+_conn_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=_POOL_SIZE)
+
+
+def _acquire_conn() -> sqlite3.Connection:
+    try:
+        return _conn_pool.get_nowait()
+    except queue.Empty:
+        return get_connection()
+
+
+def _release_conn(conn: sqlite3.Connection) -> None:
+    try:
+        conn.rollback()  # drop any dangling transaction state before reuse
+        _conn_pool.put_nowait(conn)
+    except (queue.Full, sqlite3.Error):
+        conn.close()
+
 
 def get_db() -> sqlite3.Connection:
     if "db" not in g:
-        g.db = sqlite3.connect(DB_PATH, detect_types=sqlite3.PARSE_DECLTYPES)
-        g.db.row_factory = sqlite3.Row
+        g.db = _acquire_conn()
     return g.db
 
 
@@ -169,18 +271,39 @@ def get_db() -> sqlite3.Connection:
 def close_db(exception):
     db = g.pop("db", None)
     if db is not None:
-        db.close()
+        _release_conn(db)
 
 
 def get_connection() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+    conn = sqlite3.connect(
+        DB_PATH,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=False,
+        cached_statements=256,
+    )
     conn.row_factory = sqlite3.Row
-    return conn
+    return _configure_conn(conn)
+
+
+# Hot-path SQL lives in shared constants so sqlite3's per-connection
+# statement cache keys on identical text and skips re-preparing.  Always
+# bind values with ? placeholders, never f-strings.
+INSERT_SENSOR_READING_SQL = (
+    "INSERT INTO sensor_readings(sensor_id, value, recorded_at) VALUES(?,?,?)"
+)
+INSERT_ASSISTANT_MESSAGE_SQL = (
+    "INSERT INTO assistant_messages(thread_id, role, content, provider, created_at) VALUES(?,?,?,?,?)"
+)
 
 
 def ensure_tables():
     conn = get_connection()
+    # Manage the transaction explicitly: one BEGIN IMMEDIATE around all the
+    # DDL and migrations means one fsync instead of one per statement, and
+    # sidesteps sqlite3's implicit-BEGIN interaction with DDL.
+    conn.isolation_level = None
     cur = conn.cursor()
+    cur.execute("BEGIN IMMEDIATE")
 
     cur.execute(
         """
@@ -303,6 +426,29 @@ def ensure_tables():
         )
         """
     )
+    # Keep the FTS index in sync via triggers so writers touch one table
+    # and consistency is a schema invariant rather than caller discipline.
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS rag_docs_ai AFTER INSERT ON rag_docs BEGIN
+            INSERT INTO rag_docs_fts(doc_id, title, content) VALUES (new.id, new.title, new.content);
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS rag_docs_ad AFTER DELETE ON rag_docs BEGIN
+            DELETE FROM rag_docs_fts WHERE doc_id = old.id;
+        END
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS rag_docs_au AFTER UPDATE ON rag_docs BEGIN
+            UPDATE rag_docs_fts SET title = new.title, content = new.content WHERE doc_id = new.id;
+        END
+        """
+    )
     cur.execute(
         """
         CREATE TABLE IF NOT EXISTS data_assets (
@@ -385,30 +531,47 @@ def ensure_tables():
         """
     )
 
-    conn.commit()
-
     _apply_migrations(conn)
-    conn.commit()
+
+    # Indexes for the hot FK/lookup columns; without these, "messages for
+    # thread X" style queries are full table scans.
+    for ddl in (
+        "CREATE INDEX IF NOT EXISTS idx_asstmsg_thread ON assistant_messages(thread_id, id)",
+        "CREATE INDEX IF NOT EXISTS idx_readings_sensor_time ON sensor_readings(sensor_id, recorded_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_ledger_bill ON bill_ledger(bill_id)",
+        "CREATE INDEX IF NOT EXISTS idx_sources_msg ON assistant_sources(message_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id)",
+        "CREATE INDEX IF NOT EXISTS idx_notes_project ON notes(project_id)",
+        "CREATE INDEX IF NOT EXISTS idx_threads_updated ON assistant_threads(updated_at DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_readings_recorded ON sensor_readings(recorded_at)",
+        "CREATE INDEX IF NOT EXISTS idx_projects_updated ON projects(updated_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_bills_due ON bills(due_date)",
+    ):
+        cur.execute(ddl)
+
+    cur.execute("COMMIT")
     conn.close()
 
 
 def _apply_migrations(conn: sqlite3.Connection) -> None:
     cur = conn.cursor()
 
-    def column_exists(table: str, column: str) -> bool:
-        cur.execute(f"PRAGMA table_info({table})")
-        return any(row[1] == column for row in cur.fetchall())
+    # One PRAGMA table_info per table instead of one per (table, column).
+    columns = {
+        table: {row[1] for row in cur.execute(f"PRAGMA table_info({table})").fetchall()}
+        for table in ("tasks", "notes", "assistant_messages")
+    }
 
-    if not column_exists("tasks", "project_id"):
+    if "project_id" not in columns["tasks"]:
         cur.execute("ALTER TABLE tasks ADD COLUMN project_id INTEGER")
 
-    if not column_exists("notes", "project_id"):
+    if "project_id" not in columns["notes"]:
         cur.execute("ALTER TABLE notes ADD COLUMN project_id INTEGER")
 
-    if not column_exists("assistant_messages", "thread_id"):
+    if "thread_id" not in columns["assistant_messages"]:
         cur.execute("ALTER TABLE assistant_messages ADD COLUMN thread_id INTEGER")
 
-    if not column_exists("assistant_messages", "provider"):
+    if "provider" not in columns["assistant_messages"]:
         cur.execute("ALTER TABLE assistant_messages ADD COLUMN provider TEXT")
 
     # Ensure default assistant thread exists
@@ -451,48 +614,85 @@ def _resolve_thread(conn: sqlite3.Connection, thread_id: Optional[int]):
     return thread_id, row
 
 
+# meta is tiny and only ever written through set_meta_value, so keep the
+# whole table in a process-wide dict instead of opening a SQLite
+# connection per lookup (hash_pin hits this on every auth check).
+_meta_cache: Optional[Dict[str, str]] = None
+_meta_lock = threading.Lock()
+
+
+def _load_meta_cache() -> Dict[str, str]:
+    global _meta_cache
+    if _meta_cache is None:
+        with _meta_lock:
+            if _meta_cache is None:
+                conn = get_connection()
+                try:
+                    rows = conn.execute("SELECT key, value FROM meta").fetchall()
+                finally:
+                    conn.close()
+                _meta_cache = {row["key"]: row["value"] for row in rows}
+    return _meta_cache
+
+
 def get_meta_value(key: str, default: str = None) -> str:
-    conn = get_connection()
-    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
-    conn.close()
-    if row:
-        return row["value"]
-    return default
+    return _load_meta_cache().get(key, default)
 
 
 def set_meta_value(key: str, value: str) -> None:
-    conn = get_connection()
-    conn.execute(
-        "INSERT INTO meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-        (key, value),
-    )
-    conn.commit()
-    conn.close()
+    with _meta_lock:
+        conn = get_connection()
+        try:
+            conn.execute(
+                "INSERT INTO meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        if _meta_cache is not None:
+            _meta_cache[key] = value
+
+
+_MASKS = frozenset({"••••", "***", "*** hidden ***"})
 
 
 def deep_merge(target: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
-    for key, value in updates.items():
-        if isinstance(value, dict) and isinstance(target.get(key), dict):
-            deep_merge(target[key], value)
-        else:
-            target[key] = value
+    stack = deque([(target, updates)])
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                stack.append((dst[key], value))
+            else:
+                dst[key] = value
     return target
 
 
 def strip_masked(values: Any) -> Any:
-    if isinstance(values, dict):
-        for key in list(values.keys()):
-            val = values[key]
+    if not isinstance(values, dict):
+        return values
+    stack = deque([values])
+    while stack:
+        current = stack.pop()
+        doomed = []
+        for key, val in current.items():
             if isinstance(val, dict):
-                strip_masked(val)
-            elif isinstance(val, str) and val.strip() in {"••••", "***", "*** hidden ***"}:
-                values.pop(key)
+                stack.append(val)
+            # Exact membership first; .strip() only when the raw value misses.
+            elif isinstance(val, str) and (val in _MASKS or val.strip() in _MASKS):
+                doomed.append(key)
+        for key in doomed:
+            del current[key]
     return values
 
 
 def sanitized_config() -> Dict[str, Any]:
-    data = json.loads(json.dumps(config))  # deep copy
-    integrations = data.get("integrations", {})
+    # Only the two sensitive subtrees are rewritten, so copy just those
+    # instead of deep-copying the whole config through a JSON round-trip.
+    # The rest of the tree is shared read-only with `config`.
+    data = dict(config)
+    integrations = dict(data.get("integrations", {}))
     for key in (
         "openrouter_key",
         "genesis_key",
@@ -501,15 +701,44 @@ def sanitized_config() -> Dict[str, Any]:
     ):
         if integrations.get(key):
             integrations[key] = "••••"
-    security = data.get("security", {})
+    data["integrations"] = integrations
+    security = dict(data.get("security", {}))
     for key in ("vault_passphrase", "vault_pin"):
         if security.get(key):
             security[key] = "••••"
+    data["security"] = security
     return data
 
 
 DEFAULT_REQUEST_TIMEOUT = 25
 
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Shared outbound session so provider calls reuse pooled keep-alive
+    connections instead of paying a TCP handshake per request."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=8,
+                    pool_maxsize=16,
+                    max_retries=Retry(
+                        total=2,
+                        backoff_factor=0.2,
+                        status_forcelist=[429, 502, 503, 504],
+                        allowed_methods=None,  # retry POSTs to providers too
+                    ),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
 
 def call_provider(provider: str, message: str, model: Optional[str] = None) -> Dict[str, Any]:
     provider = provider.lower()
@@ -521,11 +750,9 @@ def call_provider(provider: str, message: str, model: Optional[str] = None) -> D
         reply, sources = generate_local_summary(message)
         return {"reply": reply, "sources": sources, "provider": provider, "model": spec.get("model", "heuristic")}
 
-    integrations = config.get("integrations", {})
-    model_key = spec.get("model_key")
-    resolved_model = model or (integrations.get(model_key) if model_key else spec.get("default_model"))
-
-    key_name = spec.get("key")
+    integrations = config.get("integrations") or {}
+    key_name, model_key, default_model = _PROVIDER_SPEC_CACHE[provider]
+    resolved_model = model or (integrations.get(model_key) if model_key else default_model)
     credential = integrations.get(key_name) if key_name else None
 
     if not credential:
@@ -557,26 +784,48 @@ def call_provider(provider: str, message: str, model: Optional[str] = None) -> D
     raise ProviderError(provider, "Unsupported provider")
 
 
+def _post_json(url: str, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """POST a JSON payload, serializing with orjson when it is available.
+
+    orjson encodes straight to bytes, skipping requests' stdlib json pass
+    and the intermediate str allocation.
+    """
+    session = get_http_session()
+    if orjson is not None:
+        merged = dict(headers) if headers else {}
+        merged.setdefault("Content-Type", "application/json")
+        return session.post(url, headers=merged, data=orjson.dumps(payload), timeout=DEFAULT_REQUEST_TIMEOUT)
+    return session.post(url, headers=headers, json=payload, timeout=DEFAULT_REQUEST_TIMEOUT)
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Parse a response body bytes-direct with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Static pieces of every LLM request, built once instead of per call.
+_SYSTEM_MSG = {"role": "system", "content": "You are MONKY, a helpful operations co-pilot."}
+_OPENROUTER_HEADERS_BASE = {
+    "Content-Type": "application/json",
+    "HTTP-Referer": "http://localhost",
+    "X-Title": "MONKY",
+}
+
+
 def call_openrouter(message: str, model: str, api_key: str) -> Dict[str, Any]:
     url = "https://openrouter.ai/api/v1/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "http://localhost",
-        "X-Title": "MONKY",
-    }
+    headers = {**_OPENROUTER_HEADERS_BASE, "Authorization": f"Bearer {api_key}"}
     payload = {
         "model": model or "openrouter/auto",
-        "messages": [
-            {"role": "system", "content": "You are MONKY, a helpful operations co-pilot."},
-            {"role": "user", "content": message},
-        ],
+        "messages": [_SYSTEM_MSG, {"role": "user", "content": message}],
         "temperature": 0.4,
     }
-    response = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_REQUEST_TIMEOUT)
+    response = _post_json(url, payload, headers)
     if response.status_code >= 400:
         raise ProviderError("openrouter", response.text, status_code=response.status_code)
-    data = response.json()
+    data = _decode_json(response)
     reply = data.get("choices", [{}])[0].get("message", {}).get("content", "")
     if not reply:
         raise ProviderError("openrouter", "Empty response from OpenRouter")
@@ -592,16 +841,13 @@ def call_openai(message: str, model: str, api_key: str, base_url: str, *, api_ke
     }
     payload = {
         "model": model,
-        "messages": [
-            {"role": "system", "content": "You are MONKY, a helpful operations co-pilot."},
-            {"role": "user", "content": message},
-        ],
+        "messages": [_SYSTEM_MSG, {"role": "user", "content": message}],
         "temperature": 0.2,
     }
-    response = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_REQUEST_TIMEOUT)
+    response = _post_json(url, payload, headers)
     if response.status_code >= 400:
         raise ProviderError("openai", response.text, status_code=response.status_code)
-    data = response.json()
+    data = _decode_json(response)
     reply = data.get("choices", [{}])[0].get("message", {}).get("content", "")
     if not reply:
         raise ProviderError("openai", "Empty response from provider")
@@ -612,17 +858,14 @@ def call_ollama(message: str, model: str, host: str) -> Dict[str, Any]:
     url = f"{host}/api/chat"
     payload = {
         "model": model or "llama3",
-        "messages": [
-            {"role": "system", "content": "You are MONKY, a helpful operations co-pilot."},
-            {"role": "user", "content": message},
-        ],
+        "messages": [_SYSTEM_MSG, {"role": "user", "content": message}],
         "options": {"temperature": 0.2},
         "stream": False,
     }
-    response = requests.post(url, json=payload, timeout=DEFAULT_REQUEST_TIMEOUT)
+    response = _post_json(url, payload)
     if response.status_code >= 400:
         raise ProviderError("ollama", response.text, status_code=response.status_code)
-    data = response.json()
+    data = _decode_json(response)
     reply = data.get("message", {}).get("content")
     if not reply and "response" in data:
         reply = data.get("response")
@@ -645,6 +888,16 @@ def ensure_meta_defaults():
 
 def seed_database():
     conn = get_connection()
+    # Single explicit transaction for the whole seed pass: the interleaved
+    # COUNT(*) probes otherwise force autocommit boundaries between inserts.
+    conn.isolation_level = None
+    conn.execute("BEGIN IMMEDIATE")
+
+    # One timestamp for the whole seed pass; date.isoformat() also skips
+    # the locale-aware strftime path entirely.
+    now = datetime.utcnow()
+    today = now.date()
+    now_iso = now.isoformat()
 
     if conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0] == 0:
         conn.executemany(
@@ -655,7 +908,7 @@ def seed_database():
                     "active",
                     "A. Rivera",
                     "Refresh MONKY work cockpit with neon theming and telemetry hooks.",
-                    (datetime.utcnow() + timedelta(days=14)).strftime("%Y-%m-%d"),
+                    (today + timedelta(days=14)).isoformat(),
                     "work,priority",
                 ),
                 (
@@ -663,7 +916,7 @@ def seed_database():
                     "active",
                     "T. Nguyen",
                     "Tune smart-home schedules and budget alerts before summer.",
-                    (datetime.utcnow() + timedelta(days=21)).strftime("%Y-%m-%d"),
+                    (today + timedelta(days=21)).isoformat(),
                     "home,automation",
                 ),
             ],
@@ -680,7 +933,7 @@ def seed_database():
                     "Rebaseline sprint",
                     "Align backlog with stakeholders and prepare velocity chart.",
                     "in-progress",
-                    (datetime.utcnow() + timedelta(days=2)).strftime("%Y-%m-%d"),
+                    (today + timedelta(days=2)).isoformat(),
                     "high",
                     "Work",
                     "planning,alignment",
@@ -690,7 +943,7 @@ def seed_database():
                     "Ship MONKY dashboard",
                     "Finalize neon theming and QA flows for launch.",
                     "todo",
-                    (datetime.utcnow() + timedelta(days=5)).strftime("%Y-%m-%d"),
+                    (today + timedelta(days=5)).isoformat(),
                     "high",
                     "Work",
                     "ui,launch",
@@ -700,7 +953,7 @@ def seed_database():
                     "Tune HVAC schedule",
                     "Calibrate overnight cooling curve and humidity targets.",
                     "todo",
-                    (datetime.utcnow() + timedelta(days=3)).strftime("%Y-%m-%d"),
+                    (today + timedelta(days=3)).isoformat(),
                     "medium",
                     "Home",
                     "automation,energy",
@@ -729,8 +982,8 @@ def seed_database():
         conn.executemany(
             "INSERT INTO bills(name, amount, due_date, frequency, status, category) VALUES(?,?,?,?,?,?)",
             [
-                ("Power Utility", 120.42, (datetime.utcnow() + timedelta(days=3)).strftime("%Y-%m-%d"), "monthly", "scheduled", "utilities"),
-                ("Fiber Internet", 80.00, (datetime.utcnow() + timedelta(days=8)).strftime("%Y-%m-%d"), "monthly", "scheduled", "utilities"),
+                ("Power Utility", 120.42, (today + timedelta(days=3)).isoformat(), "monthly", "scheduled", "utilities"),
+                ("Fiber Internet", 80.00, (today + timedelta(days=8)).isoformat(), "monthly", "scheduled", "utilities"),
             ],
         )
     if conn.execute("SELECT COUNT(*) FROM sensors").fetchone()[0] == 0:
@@ -746,7 +999,7 @@ def seed_database():
                     "simulated",
                     "OK",
                     22.5,
-                    datetime.utcnow().isoformat(),
+                    now_iso,
                     "Work HQ",
                     "Thermal probe feeding MONKY",
                 ),
@@ -759,7 +1012,7 @@ def seed_database():
                     "simulated",
                     "OK",
                     7.4,
-                    datetime.utcnow().isoformat(),
+                    now_iso,
                     "Home",
                     "Simulated maintenance feed",
                 ),
@@ -772,18 +1025,17 @@ def seed_database():
                     "simulated",
                     "OK",
                     22,
-                    datetime.utcnow().isoformat(),
+                    now_iso,
                     "Home",
                     "CO₂ + particulates composite",
                 ),
             ],
         )
         sensors = conn.execute("SELECT id, last_value FROM sensors").fetchall()
-        for sensor in sensors:
-            conn.execute(
-                "INSERT INTO sensor_readings(sensor_id, value, recorded_at) VALUES(?,?,?)",
-                (sensor["id"], sensor["last_value"], datetime.utcnow().isoformat()),
-            )
+        conn.executemany(
+            INSERT_SENSOR_READING_SQL,
+            [(sensor["id"], sensor["last_value"], now_iso) for sensor in sensors],
+        )
     if conn.execute("SELECT COUNT(*) FROM rag_docs").fetchone()[0] == 0:
         conn.execute(
             "INSERT INTO rag_docs(title, content, source, tags) VALUES(?,?,?,?)",
@@ -794,11 +1046,6 @@ def seed_database():
                 "handbook,overview",
             ),
         )
-        doc_id = conn.execute("SELECT id FROM rag_docs WHERE title = ?", ("MONKY Handbook",)).fetchone()[0]
-        conn.execute(
-            "INSERT INTO rag_docs_fts(doc_id, title, content) VALUES(?,?,?)",
-            (doc_id, "MONKY Handbook", "Monitor operations, notify anomalies, keep humans in the loop."),
-        )
 
     if conn.execute("SELECT COUNT(*) FROM data_assets").fetchone()[0] == 0:
         conn.execute(
@@ -822,17 +1069,36 @@ def seed_database():
             ("Baseline KPIs", "system seed", json.dumps(sample_metrics)),
         )
 
-    conn.commit()
+    conn.execute("COMMIT")
     conn.close()
 
 
-def hash_pin(pin: str) -> str:
-    salt = get_meta_value("vault_salt")
-    if not salt:
-        ensure_meta_defaults()
+# The salt never changes after ensure_meta_defaults(), so read it from
+# SQLite once instead of opening a connection on every auth check.
+_vault_salt: Optional[bytes] = None
+
+
+def _get_vault_salt() -> bytes:
+    global _vault_salt
+    if _vault_salt is None:
         salt = get_meta_value("vault_salt")
+        if not salt:
+            ensure_meta_defaults()
+            salt = get_meta_value("vault_salt")
+        _vault_salt = base64.b64decode(salt)
+    return _vault_salt
+
+
+def hash_pin(pin: str) -> str:
+    digest = hmac.new(_get_vault_salt(), pin.encode("utf-8"), "sha256").digest()
+    return base64.b64encode(digest).decode("utf-8")
+
+
+def _legacy_hash_pin(pin: str) -> str:
+    # Pre-HMAC scheme (SHA256 over salt||pin), kept so hashes stored by
+    # older databases still verify.
     digest = hashes.Hash(hashes.SHA256(), backend=default_backend())
-    digest.update(base64.b64decode(salt))
+    digest.update(_get_vault_salt())
     digest.update(pin.encode("utf-8"))
     return base64.b64encode(digest.finalize()).decode("utf-8")
 
@@ -841,39 +1107,72 @@ def verify_pin(pin: str) -> bool:
     stored = get_meta_value("vault_pin_hash")
     if not stored:
         return False
-    return hash_pin(pin) == stored
+    if hmac.compare_digest(hash_pin(pin), stored):
+        return True
+    return hmac.compare_digest(_legacy_hash_pin(pin), stored)
+
+
+# PBKDF2 at 390k iterations is deliberately ~100 ms of CPU; the passphrase
+# and salt are stable for the life of the process, so derive once and keep
+# the key (and its AESGCM instance) instead of re-deriving per vault item.
+_vault_key: Optional[bytes] = None
+_vault_aesgcm: Optional[AESGCM] = None
+_vault_key_lock = threading.Lock()
 
 
 def derive_vault_key() -> bytes:
-    passphrase = config.get("security", {}).get("vault_passphrase")
-    if not passphrase:
-        raise RuntimeError("Vault passphrase missing in configuration.")
-    salt = base64.b64decode(get_meta_value("vault_salt"))
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=390000,
-        backend=default_backend(),
-    )
-    return kdf.derive(passphrase.encode("utf-8"))
+    global _vault_key, _vault_aesgcm
+    if _vault_key is not None:
+        return _vault_key
+    with _vault_key_lock:
+        if _vault_key is not None:
+            return _vault_key
+        passphrase = config.get("security", {}).get("vault_passphrase")
+        if not passphrase:
+            raise RuntimeError("Vault passphrase missing in configuration.")
+        salt = base64.b64decode(get_meta_value("vault_salt"))
+        # hashlib's pbkdf2_hmac hits OpenSSL's C routine directly (and
+        # releases the GIL); same derivation, less wrapper glue.
+        _vault_key = hashlib.pbkdf2_hmac(
+            "sha256", passphrase.encode("utf-8"), salt, 390000, dklen=32
+        )
+        _vault_aesgcm = AESGCM(_vault_key)
+        return _vault_key
+
+
+def invalidate_vault_key() -> None:
+    """Drop the cached key after a passphrase or salt change."""
+    global _vault_key, _vault_aesgcm
+    with _vault_key_lock:
+        _vault_key = None
+        _vault_aesgcm = None
+
+
+def _vault_cipher() -> AESGCM:
+    derive_vault_key()
+    return _vault_aesgcm
 
 
 def encrypt_secret(plaintext: str) -> Dict[str, bytes]:
-    key = derive_vault_key()
-    aes = AESGCM(key)
+    aes = _vault_cipher()
     nonce = os.urandom(12)
     data = aes.encrypt(nonce, plaintext.encode("utf-8"), None)
     return {"nonce": nonce, "ciphertext": data[:-16], "tag": data[-16:]}
 
 
 def decrypt_secret(nonce: bytes, ciphertext: bytes, tag: bytes) -> str:
-    key = derive_vault_key()
-    aes = AESGCM(key)
+    aes = _vault_cipher()
     return aes.decrypt(nonce, ciphertext + tag, None).decode("utf-8")
 
 
-def enabled_apps() -> Dict[str, bool]:
+# Feature lookups run on every page route and scheduler tick but only
+# change when the config is mutated, so memoize them keyed on a version
+# counter that persist_config() bumps.
+_config_version = 0
+
+
+@lru_cache(maxsize=4)
+def _enabled_apps(version: int) -> Dict[str, bool]:
     features = config.get("features", {})
     return {
         "work": bool(features.get("work", True)),
@@ -882,10 +1181,19 @@ def enabled_apps() -> Dict[str, bool]:
     }
 
 
-def sensor_simulation_enabled() -> bool:
+def enabled_apps() -> Dict[str, bool]:
+    return _enabled_apps(_config_version)
+
+
+@lru_cache(maxsize=4)
+def _sensor_simulation_enabled(version: int) -> bool:
     return bool(config.get("features", {}).get("sensor_simulation", True))
 
 
+def sensor_simulation_enabled() -> bool:
+    return _sensor_simulation_enabled(_config_version)
+
+
 def ensure_scheduler():
     global _scheduler_started
     if not sensor_simulation_enabled():
@@ -897,7 +1205,18 @@ def ensure_scheduler():
         except Exception:
             job = None
         if job is None:
-            scheduler.add_job(simulate_sensors, "interval", seconds=45, id="sensor-sim", replace_existing=True)
+            scheduler.add_job(
+                simulate_sensors,
+                "interval",
+                seconds=45,
+                id="sensor-sim",
+                replace_existing=True,
+                # Collapse runs missed during a sleep/suspend into one and
+                # never overlap ticks, so resume doesn't hammer the writer.
+                coalesce=True,
+                max_instances=1,
+                misfire_grace_time=30,
+            )
         try:
             scheduler.resume()
         except Exception:
@@ -907,39 +1226,94 @@ def ensure_scheduler():
         _scheduler_started = True
 
 
+_sensor_rng = np.random.default_rng()
+
+
 def simulate_sensors():
     conn = get_connection()
     sensors = conn.execute("SELECT * FROM sensors").fetchall()
-    for sensor in sensors:
-        normal_min = sensor["normal_min"] or 0
-        normal_max = sensor["normal_max"] or 100
-        mid = (normal_min + normal_max) / 2.0
-        spread = (normal_max - normal_min) / 6.0 if normal_max != normal_min else 5
-        new_value = random.gauss(mid, spread)
-        status = "OK"
-        if new_value < normal_min or new_value > normal_max:
-            status = "Out-of-Range"
-        elif abs(new_value - mid) > (normal_max - normal_min) * 0.35:
-            status = "Drift"
-        conn.execute(
-            "INSERT INTO sensor_readings(sensor_id, value, recorded_at) VALUES(?,?,?)",
-            (sensor["id"], new_value, datetime.utcnow().isoformat()),
-        )
-        conn.execute(
+    if not sensors:
+        conn.close()
+        return
+    now = datetime.utcnow()
+    now_iso = now.isoformat()
+    # Vectorized draw + status classification: one C-level pass over all
+    # sensors instead of per-sensor interpreter arithmetic.
+    mins = np.array([s["normal_min"] or 0 for s in sensors], dtype=float)
+    maxs = np.array([s["normal_max"] or 100 for s in sensors], dtype=float)
+    mid = (mins + maxs) / 2.0
+    # abs() tolerates inverted ranges (normal_min > normal_max can be
+    # written via the sensor update endpoint); Generator.normal raises on
+    # a negative scale where random.gauss did not.
+    spread = np.where(maxs != mins, np.abs(maxs - mins) / 6.0, 5.0)
+    values = _sensor_rng.normal(mid, spread)
+    out_of_range = (values < mins) | (values > maxs)
+    drift = np.abs(values - mid) > (maxs - mins) * 0.35
+    statuses = np.where(out_of_range, "Out-of-Range", np.where(drift, "Drift", "OK"))
+    readings = [(s["id"], float(v), now_iso) for s, v in zip(sensors, values)]
+    updates = [
+        (float(v), now_iso, str(status), s["id"])
+        for s, v, status in zip(sensors, values, statuses)
+    ]
+    cutoff = (now - timedelta(days=3)).isoformat()
+    # One transaction for the whole tick: 2N+1 autocommit fsyncs become one.
+    with conn:
+        conn.executemany(INSERT_SENSOR_READING_SQL, readings)
+        conn.executemany(
             "UPDATE sensors SET last_value = ?, last_updated = ?, status = ? WHERE id = ?",
-            (new_value, datetime.utcnow().isoformat(), status, sensor["id"]),
+            updates,
         )
-    cutoff = datetime.utcnow() - timedelta(days=3)
-    conn.execute("DELETE FROM sensor_readings WHERE recorded_at < ?", (cutoff.isoformat(),))
-    conn.commit()
+        conn.execute("DELETE FROM sensor_readings WHERE recorded_at < ?", (cutoff,))
     conn.close()
 
 
+_page_cache: Dict[str, tuple] = {}
+
+# The page routes only ever serve these shells; resolve their paths and
+# content types once instead of per request.
+_PAGE_TABLE: Dict[str, tuple] = {
+    name: (BASE_DIR / name, mimetypes.guess_type(name)[0] or "application/octet-stream")
+    for name in (
+        "index_selector.html",
+        "index_work.html",
+        "index_home.html",
+        "index_mobile.html",
+        "index_server.html",
+    )
+}
+
+
 def _serve_file_or_404(filename: str):
-    path = BASE_DIR / filename
-    if not path.exists():
+    entry = _PAGE_TABLE.get(filename)
+    if entry is None:
+        entry = (BASE_DIR / filename, mimetypes.guess_type(filename)[0] or "application/octet-stream")
+    path, mimetype = entry
+    try:
+        stat = path.stat()
+    except OSError:
         abort(404, description=f"Missing asset {filename}")
-    return send_from_directory(BASE_DIR, filename)
+    # Serve page shells from memory; the mtime check keeps live edits
+    # visible without re-reading the file on every request. The gzip
+    # variant is compressed once per mtime, not per request.
+    cached = _page_cache.get(filename)
+    if cached is None or cached[0] != stat.st_mtime_ns:
+        body = path.read_bytes()
+        etag = f'"{stat.st_mtime_ns:x}-{len(body):x}"'
+        cached = (stat.st_mtime_ns, body, gzip.compress(body, compresslevel=6), etag)
+        _page_cache[filename] = cached
+    etag = cached[3]
+    # Conditional GET short-circuit: a revalidating browser gets a bodyless
+    # 304 instead of the full shell.
+    if etag in request.headers.get("If-None-Match", ""):
+        response = app.response_class(status=304)
+    elif "gzip" in request.headers.get("Accept-Encoding", "").lower():
+        response = app.response_class(cached[2], mimetype=mimetype)
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = app.response_class(cached[1], mimetype=mimetype)
+    response.headers["ETag"] = etag
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
 
 
 @app.route("/")
@@ -1029,17 +1403,24 @@ def assistant_providers():
 def assistant_threads():
     conn = get_db()
     if request.method == "GET":
+        # Latest message per thread via a window function: one statement
+        # instead of one preview query per thread.
         rows = conn.execute(
-            "SELECT id, title, created_at, updated_at FROM assistant_threads ORDER BY updated_at DESC"
+            """
+            SELECT t.id, t.title, t.created_at, t.updated_at, m.content AS preview
+            FROM assistant_threads t
+            LEFT JOIN (
+                SELECT thread_id, content,
+                       ROW_NUMBER() OVER (PARTITION BY thread_id ORDER BY id DESC) AS rn
+                FROM assistant_messages
+            ) m ON m.thread_id = t.id AND m.rn = 1
+            ORDER BY t.updated_at DESC
+            """
         ).fetchall()
         threads = []
         for row in rows:
-            preview = conn.execute(
-                "SELECT content FROM assistant_messages WHERE thread_id = ? ORDER BY id DESC LIMIT 1",
-                (row["id"],),
-            ).fetchone()
             item = dict(row)
-            item["preview"] = preview["content"] if preview else ""
+            item["preview"] = item["preview"] or ""
             threads.append(item)
         return jsonify(threads)
 
@@ -1123,7 +1504,7 @@ def assistant_send():
     now = datetime.utcnow().isoformat()
     cur = conn.cursor()
     cur.execute(
-        "INSERT INTO assistant_messages(thread_id, role, content, provider, created_at) VALUES(?,?,?,?,?)",
+        INSERT_ASSISTANT_MESSAGE_SQL,
         (thread_id, "user", message, provider, now),
     )
 
@@ -1144,9 +1525,12 @@ def assistant_send():
             }
         ] + fallback_sources
 
+    # One timestamp for the reply and the thread bump below; the provider
+    # round-trip already happened, so they are the same instant anyway.
+    replied_at = datetime.utcnow().isoformat()
     cur.execute(
-        "INSERT INTO assistant_messages(thread_id, role, content, provider, created_at) VALUES(?,?,?,?,?)",
-        (thread_id, "assistant", reply, provider_used, datetime.utcnow().isoformat()),
+        INSERT_ASSISTANT_MESSAGE_SQL,
+        (thread_id, "assistant", reply, provider_used, replied_at),
     )
     assistant_message_id = cur.lastrowid
     for src in sources:
@@ -1162,7 +1546,7 @@ def assistant_send():
 
     cur.execute(
         "UPDATE assistant_threads SET updated_at = ? WHERE id = ?",
-        (datetime.utcnow().isoformat(), thread_id),
+        (replied_at, thread_id),
     )
     conn.commit()
 
@@ -1175,8 +1559,18 @@ def assistant_send():
     })
 
 
-@app.route("/assistant/ping/<string:provider>")
-def assistant_ping(provider: str):
+# Readiness probes are cheap to ask for (every dashboard refresh hits them)
+# but expensive to answer — each one is a full provider round-trip, and
+# re-probing a provider that is already down only worsens the outage.  Cache
+# the result per provider for a few seconds and collapse concurrent probes of
+# the same provider onto a single upstream call.
+_PING_TTL_SECONDS = 5.0
+_ping_cache: Dict[str, tuple] = {}
+_ping_locks: Dict[str, threading.Lock] = {}
+_ping_locks_guard = threading.Lock()
+
+
+def probe_provider(provider: str) -> Dict[str, Any]:
     start = time.perf_counter()
     try:
         result = call_provider(provider, "MONKY readiness ping.")
@@ -1189,27 +1583,42 @@ def assistant_ping(provider: str):
         ok = False
         detail = str(exc)
     latency_ms = round((time.perf_counter() - start) * 1000)
-    status = 200 if ok else 502
-    return jsonify({"provider": provider, "ok": ok, "detail": detail, "latency_ms": latency_ms}), status
+    return {"provider": provider, "ok": ok, "detail": detail, "latency_ms": latency_ms}
+
+
+def cached_probe(provider: str, ttl: float = _PING_TTL_SECONDS) -> Dict[str, Any]:
+    hit = _ping_cache.get(provider)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    with _ping_locks_guard:
+        lock = _ping_locks.setdefault(provider, threading.Lock())
+    with lock:
+        hit = _ping_cache.get(provider)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        result = probe_provider(provider)
+        _ping_cache[provider] = (time.monotonic(), result)
+        return result
+
+
+@app.route("/assistant/ping/<string:provider>")
+def assistant_ping(provider: str):
+    result = cached_probe(provider)
+    status = 200 if result["ok"] else 502
+    return jsonify(result), status
+
+
+# Probes are pure I/O waits, so fan them out: wall time for /assistant/ping
+# becomes the slowest provider instead of the sum of all of them.  The
+# per-provider locks in cached_probe keep the single-flight behavior.
+_ping_executor = ThreadPoolExecutor(
+    max_workers=len(PROVIDER_DEFINITIONS), thread_name_prefix="monky-ping"
+)
 
 
 @app.route("/assistant/ping", methods=["GET"])
 def assistant_ping_all():
-    results = []
-    for provider in PROVIDER_DEFINITIONS.keys():
-        start = time.perf_counter()
-        try:
-            result = call_provider(provider, "MONKY readiness ping.")
-            ok = True
-            detail = result.get("reply", "")[:180]
-        except ProviderError as exc:
-            ok = False
-            detail = exc.detail
-        except Exception as exc:  # pragma: no cover
-            ok = False
-            detail = str(exc)
-        latency_ms = round((time.perf_counter() - start) * 1000)
-        results.append({"provider": provider, "ok": ok, "detail": detail, "latency_ms": latency_ms})
+    results = list(_ping_executor.map(cached_probe, PROVIDER_DEFINITIONS.keys()))
     return jsonify({"results": results})
 
 
@@ -1230,7 +1639,17 @@ def assistant_test():
 
 def generate_local_summary(message: str):
     keywords = {token.lower().strip(".,!?") for token in message.split() if len(token) > 3}
-    conn = get_connection()
+    # One compiled alternation instead of len(keywords) substring scans
+    # per row across every section below.
+    keyword_pattern = (
+        re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
+        if keywords
+        else None
+    )
+    # Borrow a pooled connection: its statement cache already holds these
+    # SELECTs after the first fallback, so repeat calls skip both the
+    # sqlite3_open and the per-statement prepare cost.
+    conn = _acquire_conn()
     sources: List[Dict] = []
     summaries: List[str] = []
 
@@ -1248,8 +1667,8 @@ def generate_local_summary(message: str):
             )
             summaries.append(line)
         for proj in project_rows:
-            haystack = (proj["name"] or "").lower()
-            if keywords and any(k in haystack for k in keywords):
+            haystack = proj["name"] or ""
+            if keyword_pattern and keyword_pattern.search(haystack):
                 sources.append(
                     {
                         "kind": "project",
@@ -1267,8 +1686,8 @@ def generate_local_summary(message: str):
         next_due = open_tasks[0]["due_date"] or "n/a"
         summaries.append(f"Tasks: {len(open_tasks)} active · next due {next_due}")
     for task in task_rows:
-        haystack = f"{task['title']} {task['description']}".lower()
-        if keywords and any(k in haystack for k in keywords):
+        haystack = f"{task['title']} {task['description']}"
+        if keyword_pattern and keyword_pattern.search(haystack):
             sources.append(
                 {
                     "kind": "task",
@@ -1284,8 +1703,8 @@ def generate_local_summary(message: str):
     if note_rows:
         summaries.append(f"Notes: latest entry '{note_rows[0]['title']}'")
     for note in note_rows:
-        haystack = f"{note['title']} {note['content']}".lower()
-        if keywords and any(k in haystack for k in keywords):
+        haystack = f"{note['title']} {note['content']}"
+        if keyword_pattern and keyword_pattern.search(haystack):
             sources.append(
                 {
                     "kind": "note",
@@ -1297,6 +1716,7 @@ def generate_local_summary(message: str):
     # Bills and budget insight
     bill_rows = conn.execute("SELECT id, name, amount, due_date, status, category FROM bills").fetchall()
     due_soon = []
+    now = datetime.utcnow()
     for bill in bill_rows:
         due = bill["due_date"]
         if due:
@@ -1309,10 +1729,10 @@ def generate_local_summary(message: str):
                     due_dt = None
         else:
             due_dt = None
-        if due_dt and due_dt - datetime.now(datetime.UTC) <= timedelta(days=7) and bill["status"] != "paid":
+        if due_dt and due_dt - now <= timedelta(days=7) and bill["status"] != "paid":
             due_soon.append(bill)
-        haystack = (bill["name"] or "").lower()
-        if keywords and any(k in haystack for k in keywords):
+        haystack = bill["name"] or ""
+        if keyword_pattern and keyword_pattern.search(haystack):
             sources.append(
                 {
                     "kind": "bill",
@@ -1328,16 +1748,17 @@ def generate_local_summary(message: str):
         )
 
     # KPI insights
+    # Select the raw blob: json_extract would raise OperationalError at
+    # query time on a corrupt row, while _parse_metrics degrades to {}.
+    # It is a single LIMIT 1 row, so the lazy-extract saving is negligible.
     kpi_row = conn.execute(
         "SELECT id, name, metrics_json FROM kpi_datasets ORDER BY uploaded_at DESC LIMIT 1"
     ).fetchone()
     if kpi_row:
-        try:
-            metrics_payload = json.loads(kpi_row["metrics_json"])
-        except Exception:
+        metrics_payload = _parse_metrics(kpi_row["metrics_json"])
+        if not isinstance(metrics_payload, dict):
             metrics_payload = {}
-
-        metric_section = metrics_payload.get("metrics") if isinstance(metrics_payload, dict) else {}
+        metric_section = metrics_payload.get("metrics") or {}
         if metric_section:
             first_key = next(iter(metric_section))
             summary_metric = metric_section[first_key]
@@ -1371,9 +1792,12 @@ def generate_local_summary(message: str):
                 }
             )
 
-    # RAG search augmentation
-    if keywords:
-        query = " OR ".join(keywords)
+    # RAG search augmentation.  Cap and quote the terms: very long prompts
+    # otherwise build pathological FTS match trees, and quoting keeps any
+    # FTS5 operators inside user text inert.
+    fts_terms = sorted((k for k in keywords if k.isalnum()), key=len, reverse=True)[:8]
+    if fts_terms:
+        query = " OR ".join(f'"{k}"' for k in fts_terms)
         rag_hits = conn.execute(
             "SELECT doc_id, title, snippet(rag_docs_fts, 1, '<b>', '</b>', '…', 20) AS excerpt FROM rag_docs_fts WHERE rag_docs_fts MATCH ? LIMIT 5",
             (query,),
@@ -1389,7 +1813,7 @@ def generate_local_summary(message: str):
         if rag_hits:
             summaries.append(f"Knowledge base surfaced {len(rag_hits)} reference(s).")
 
-    conn.close()
+    _release_conn(conn)
     if not summaries:
         summaries.append("Standing by. No anomalies detected across projects, budgets, or sensors.")
     reply = "\n".join(f"• {line}" for line in summaries)
@@ -1397,7 +1821,7 @@ def generate_local_summary(message: str):
 
 
 def tray_available() -> bool:
-    if pystray is None or not _PIL_AVAILABLE:
+    if not _PYSTRAY_AVAILABLE or not _PIL_AVAILABLE:
         return False
     if os.name == "posix" and not os.environ.get("DISPLAY"):
         return False
@@ -1431,12 +1855,23 @@ def start_tray(host: str, port: int) -> None:
     if not tray_available() or _tray_icon is not None:
         return
 
+    import pystray
+    from PIL import Image, ImageDraw
+
     def _make_icon():
-        base = Image.new("RGBA", (64, 64), (8, 10, 18, 255))
-        draw = ImageDraw.Draw(base)
-        draw.rectangle([10, 10, 54, 54], outline=(88, 247, 255, 255), width=2)
-        draw.text((23, 18), "M", fill=(88, 247, 255, 255))
-        return base
+        # Render once and keep the PNG bytes: the draw/text path drags in
+        # PIL's lazy font loader, which is the slow part of tray startup.
+        global _tray_icon_png
+        if _tray_icon_png is None:
+            base = Image.new("RGBA", (64, 64), (8, 10, 18, 255))
+            draw = ImageDraw.Draw(base)
+            draw.rectangle([10, 10, 54, 54], outline=(88, 247, 255, 255), width=2)
+            draw.text((23, 18), "M", fill=(88, 247, 255, 255))
+            buf = io.BytesIO()
+            base.save(buf, format="PNG")
+            _tray_icon_png = buf.getvalue()
+            return base
+        return Image.open(io.BytesIO(_tray_icon_png))
 
     menu = pystray.Menu(
         pystray.MenuItem("Open Launcher", lambda icon, item: _tray_open(host, port, "/launch")),
@@ -1491,10 +1926,6 @@ def rag_docs():
         (title, content, source, tags),
     )
     doc_id = cur.lastrowid
-    cur.execute(
-        "INSERT INTO rag_docs_fts(doc_id, title, content) VALUES(?,?,?)",
-        (doc_id, title, content),
-    )
     conn.commit()
     return jsonify({"id": doc_id, "title": title})
 
@@ -1503,7 +1934,6 @@ def rag_docs():
 def rag_delete(doc_id: int):
     conn = get_db()
     conn.execute("DELETE FROM rag_docs WHERE id = ?", (doc_id,))
-    conn.execute("DELETE FROM rag_docs_fts WHERE doc_id = ?", (doc_id,))
     conn.commit()
     return jsonify({"ok": True})
 
@@ -1650,6 +2080,22 @@ def projects_update(project_id: int):
     return jsonify({"ok": True})
 
 
+def _parse_metrics(raw) -> Dict[str, Any]:
+    """Decode a kpi_datasets.metrics_json payload, tolerating bad rows.
+
+    Goes through orjson's bytes-direct C parser when available; KPI blobs
+    are the largest JSON values the dashboard reads.
+    """
+    if not raw:
+        return {}
+    try:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    except Exception:
+        return {}
+
+
 @app.route("/kpi/datasets", methods=["GET"])
 def kpi_datasets():
     conn = get_db()
@@ -1659,10 +2105,7 @@ def kpi_datasets():
     datasets = []
     for row in rows:
         data = dict(row)
-        try:
-            data["metrics"] = json.loads(data.pop("metrics_json"))
-        except Exception:
-            data["metrics"] = {}
+        data["metrics"] = _parse_metrics(data.pop("metrics_json"))
         datasets.append(data)
     return jsonify(datasets)
 
@@ -1683,7 +2126,10 @@ def kpi_upload():
 
     try:
         if upload.filename.lower().endswith(".csv"):
-            df = pd.read_csv(io.BytesIO(buffer))
+            if _PYARROW_AVAILABLE:
+                df = pd.read_csv(io.BytesIO(buffer), engine="pyarrow")
+            else:
+                df = pd.read_csv(io.BytesIO(buffer))
         else:
             df = pd.read_excel(io.BytesIO(buffer))
     except Exception as exc:
@@ -1691,16 +2137,18 @@ def kpi_upload():
 
     numeric = df.select_dtypes(include=["number", "float", "int"])
     metrics: Dict[str, Dict[str, float]] = {}
-    for column in numeric.columns:
-        series = numeric[column].dropna()
-        if not len(series):
-            continue
-        metrics[column] = {
-            "sum": float(series.sum()),
-            "avg": float(series.mean()),
-            "min": float(series.min()),
-            "max": float(series.max()),
-        }
+    if len(numeric.columns):
+        # One vectorized pass computes all four reductions per column.
+        agg = numeric.agg(["sum", "mean", "min", "max"])
+        for column in agg.columns:
+            if numeric[column].count() == 0:
+                continue
+            metrics[column] = {
+                "sum": float(agg.at["sum", column]),
+                "avg": float(agg.at["mean", column]),
+                "min": float(agg.at["min", column]),
+                "max": float(agg.at["max", column]),
+            }
 
     sample_rows = df.head(10).to_dict(orient="records")
     payload = {
@@ -1954,10 +2402,7 @@ def dashboard_scope(scope: str):
         datasets = []
         for row in kpi_rows:
             item = dict(row)
-            try:
-                item["metrics"] = json.loads(item.pop("metrics_json"))
-            except Exception:
-                item["metrics"] = {}
+            item["metrics"] = _parse_metrics(item.pop("metrics_json"))
             datasets.append(item)
         summary["kpi"] = datasets
         summary["data_assets"] = [
@@ -2267,8 +2712,10 @@ def settings_config():
         abort(400, description="Invalid configuration payload")
     updates = strip_masked(json.loads(json.dumps(payload)))
     deep_merge(config, updates)
+    if "vault_passphrase" in updates.get("security", {}):
+        invalidate_vault_key()
     try:
-        CONFIG_PATH.write_text(json.dumps(config, indent=2), encoding="utf-8")
+        persist_config()
     except Exception as exc:
         abort(500, description=str(exc))
     return jsonify({"config": sanitized_config()})
@@ -2333,10 +2780,8 @@ def dev_ping():
     url = payload.get("url")
     if not url:
         abort(400, description="URL required")
-    import requests
-
     try:
-        response = requests.get(url, timeout=5)
+        response = get_http_session().get(url, timeout=5)
         return jsonify({"status": response.status_code})
     except Exception as exc:
         return jsonify({"error": str(exc)}), 502
@@ -2345,23 +2790,28 @@ def dev_ping():
 @app.route("/dev/toggles", methods=["POST"])
 def dev_toggles():
     payload = request.get_json(force=True)
+    simulation = None
     if "sensor_simulation" in payload:
-        config.setdefault("features", {})["sensor_simulation"] = bool(payload["sensor_simulation"])
-        if payload["sensor_simulation"]:
-            ensure_scheduler()
-        else:
-            with _scheduler_lock:
-                try:
-                    scheduler.remove_job("sensor-sim")
-                except Exception:
-                    pass
-            config["features"]["sensor_simulation"] = False
-            if scheduler.running:
-                scheduler.pause()
+        simulation = bool(payload["sensor_simulation"])
+        config.setdefault("features", {})["sensor_simulation"] = simulation
+    # Persist before touching the scheduler: persist_config() bumps the
+    # config version, and ensure_scheduler() consults the memoized
+    # sensor_simulation_enabled(), which would otherwise still see the
+    # pre-toggle flag.
     try:
-        CONFIG_PATH.write_text(json.dumps(config, indent=2), encoding="utf-8")
+        persist_config()
     except Exception:
         pass
+    if simulation:
+        ensure_scheduler()
+    elif simulation is not None:
+        with _scheduler_lock:
+            try:
+                scheduler.remove_job("sensor-sim")
+            except Exception:
+                pass
+        if scheduler.running:
+            scheduler.pause()
     return jsonify({"features": config.get("features")})
 
 
@@ -2388,14 +2838,24 @@ bootstrap()
 if __name__ == "__main__":
     host = config.get("server", {}).get("host", "127.0.0.1")
     desired_port = int(config.get("server", {}).get("port", 5050))
-    try:
-        port = find_available_port(host, desired_port)
-        if port != desired_port:
-            print(f"[MONKY] Port {desired_port} unavailable; hopped to {port}")
-            config.setdefault("server", {})["port"] = port
-    except Exception as exc:
-        print(f"[MONKY] Failed to find available port: {exc}")
-        raise
+    listen_fd = os.environ.pop("MONKY_LISTEN_FD", None)
+    if listen_fd is not None:
+        # Socket handed off by the launcher; let werkzeug adopt the
+        # already-bound fd instead of binding (and possibly hopping)
+        # again. Werkzeug only reads the fd when it believes it is the
+        # reloader child, hence the WERKZEUG_RUN_MAIN marker.
+        os.environ["WERKZEUG_SERVER_FD"] = listen_fd
+        os.environ["WERKZEUG_RUN_MAIN"] = "true"
+        port = desired_port
+    else:
+        try:
+            port = find_available_port(host, desired_port)
+            if port != desired_port:
+                print(f"[MONKY] Port {desired_port} unavailable; hopped to {port}")
+                config.setdefault("server", {})["port"] = port
+        except Exception as exc:
+            print(f"[MONKY] Failed to find available port: {exc}")
+            raise
 
     def _handle_signal(_signum, _frame):  # pragma: no cover - system signal
         shutdown_application(0)
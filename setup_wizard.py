@@ -19,6 +19,8 @@ from pathlib import Path
 from tkinter import filedialog, messagebox
 from typing import Any, Dict, Iterable, List, Tuple
 
+from utils import get_python_executable
+
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_PATH = BASE_DIR / "config.json"
 TEMPLATE_PATH = BASE_DIR / "config_template.json"
@@ -112,6 +114,17 @@ TOGGLE_FIELDS: List[Tuple[str, Tuple[str, ...]]] = [
     ("Assistant embeddings", ("features", "assistant_embeddings")),
 ]
 
+# Shared widget styling, built once instead of re-spelled per widget.
+WINDOW_BG = "#090b13"
+LABEL_STYLE: Dict[str, Any] = {"fg": "#f5f8ff", "bg": WINDOW_BG, "anchor": "w"}
+ENTRY_STYLE: Dict[str, Any] = {"width": 38, "fg": "#05060a", "bg": "#e2e8ff"}
+CHECK_STYLE: Dict[str, Any] = {
+    "fg": "#d2dcff",
+    "bg": WINDOW_BG,
+    "activebackground": WINDOW_BG,
+    "selectcolor": "#141a2a",
+}
+
 
 def deep_update(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """Recursively merge *override* into *base*."""
@@ -164,22 +177,26 @@ def set_nested(data: Dict[str, Any], path: Iterable[str], value: Any) -> None:
     current[path[-1]] = value
 
 
-from utils import get_python_executable
-
 def launch_monky_process() -> None:
     python = get_python_executable()
     subprocess.Popen([python, str(BASE_DIR / "launch_monky.py")])
 
 
 def write_config(config: Dict[str, Any]) -> None:
-    CONFIG_PATH.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    payload = json.dumps(config, indent=2)
+    try:
+        if CONFIG_PATH.read_text(encoding="utf-8") == payload:
+            return
+    except OSError:
+        pass
+    CONFIG_PATH.write_text(payload, encoding="utf-8")
 
 
 class WizardApp(tk.Tk):
     def __init__(self, *, auto_launch: bool = True):
         super().__init__()
         self.title("MONKY Setup Wizard")
-        self.configure(bg="#090b13")
+        self.configure(bg=WINDOW_BG)
         self.resizable(False, False)
         self.auto_launch = auto_launch
         self.template = load_template_data()
@@ -194,7 +211,7 @@ class WizardApp(tk.Tk):
             text="Welcome to MONKY",
             font=("Segoe UI", 16, "bold"),
             fg="#58f7ff",
-            bg="#090b13",
+            bg=WINDOW_BG,
         )
         title.grid(row=0, column=0, columnspan=3, padx=24, pady=(20, 8))
         subtitle = tk.Label(
@@ -202,7 +219,7 @@ class WizardApp(tk.Tk):
             text="Configure local keys, storage paths, and cockpit toggles",
             font=("Segoe UI", 10),
             fg="#b7c1e2",
-            bg="#090b13",
+            bg=WINDOW_BG,
         )
         subtitle.grid(row=1, column=0, columnspan=3, padx=24, pady=(0, 20))
 
@@ -215,10 +232,10 @@ class WizardApp(tk.Tk):
             current = get_nested(self.template, path, "")
             placeholder = "" if current is None else str(current)
 
-            tk.Label(self, text=label, fg="#f5f8ff", bg="#090b13", anchor="w").grid(
+            tk.Label(self, text=label, **LABEL_STYLE).grid(
                 row=row, column=0, sticky="w", padx=(24, 12), pady=6
             )
-            entry = tk.Entry(self, width=38, fg="#05060a", bg="#e2e8ff")
+            entry = tk.Entry(self, **ENTRY_STYLE)
             entry.insert(0, placeholder)
             entry.grid(row=row, column=1, padx=(0, 12), pady=6, sticky="we")
             self.entries[path] = entry
@@ -228,11 +245,11 @@ class WizardApp(tk.Tk):
                 btn = tk.Button(self, text="Browse", command=lambda e=entry, m=browse: self.browse_path(e, m))
                 btn.grid(row=row, column=2, padx=(0, 24), pady=6)
             else:
-                spacer = tk.Label(self, text="", bg="#090b13")
+                spacer = tk.Label(self, text="", bg=WINDOW_BG)
                 spacer.grid(row=row, column=2, padx=(0, 24), pady=6)
             row += 1
 
-        tk.Label(self, text="Enable apps", fg="#f5f8ff", bg="#090b13", anchor="w").grid(
+        tk.Label(self, text="Enable apps", **LABEL_STYLE).grid(
             row=row, column=0, padx=(24, 12), pady=(18, 6), sticky="w"
         )
         row += 1
@@ -240,20 +257,12 @@ class WizardApp(tk.Tk):
         for label, path in TOGGLE_FIELDS:
             value = bool(get_nested(self.template, path, True))
             var = tk.BooleanVar(value=value)
-            chk = tk.Checkbutton(
-                self,
-                text=label,
-                variable=var,
-                fg="#d2dcff",
-                bg="#090b13",
-                activebackground="#090b13",
-                selectcolor="#141a2a",
-            )
+            chk = tk.Checkbutton(self, text=label, variable=var, **CHECK_STYLE)
             chk.grid(row=row, column=0, columnspan=2, padx=(24, 12), sticky="w")
             self.checks[tuple(path)] = var
             row += 1
 
-        footer = tk.Frame(self, bg="#090b13")
+        footer = tk.Frame(self, bg=WINDOW_BG)
         footer.grid(row=row, column=0, columnspan=3, pady=(24, 20))
         tk.Button(footer, text="Cancel", command=self.destroy).pack(side=tk.RIGHT, padx=6)
         tk.Button(footer, text="Save & Launch", command=self.save_config).pack(side=tk.RIGHT, padx=6)
@@ -0,0 +1,21 @@
+"""Small helpers shared between the launcher and the setup wizard."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+
+def get_python_executable() -> str:
+    """Return the interpreter to spawn MONKY children with.
+
+    Prefers ``pythonw.exe`` on Windows so background processes do not
+    flash a console window.
+    """
+    python = sys.executable
+    if os.name == "nt":
+        pythonw = Path(python).with_name("pythonw.exe")
+        if pythonw.exists():
+            return str(pythonw)
+    return python